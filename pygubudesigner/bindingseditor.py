@@ -15,6 +15,7 @@ import tkinter.ttk as ttk
 
 from pygubu import builder
 from pygubu.widgets.editabletreeview import InplaceEditor
+from .util import get_ttk_style
 from .widgets.bindingeditor import EventHandlerEditor, SequenceEditor
 
 CLASS_MAP = builder.CLASS_MAP
@@ -90,7 +91,7 @@ class BindingsEditor:
         self._setup_style()
 
     def _setup_style(self, event=None):
-        style = ttk.Style()
+        style = get_ttk_style()
         theme = style.theme_use()
         if theme not in BindingsEditor.style_initialized:
             stylename = 'BindingsEditor.Treeview'
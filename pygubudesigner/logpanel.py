@@ -14,6 +14,7 @@ class LogPanelManager:
         self.gcontainer.pack_forget()
         self.btn_messages_label = self.btn_messages.cget('text')
         self.unread = 0
+        self._pending_messages = []
 
     def pwindow_configure(self, event):
         self.mainpw_sash_pos = None
@@ -61,9 +62,16 @@ class LogPanelManager:
         tktext.see('end')
 
     def log_message(self, msg, level):
+        # Messages are added in one batch when the app is idle
+        if not self._pending_messages:
+            self.txt_log.after_idle(self._flush_messages)
+        self._pending_messages.append(msg)
+
+    def _flush_messages(self):
+        messages, self._pending_messages = self._pending_messages, []
         if self.buttonsvar.get() != 'messages':
-            self.unread += 1
+            self.unread += len(messages)
             # log panel is not visible, update label
             label = f'{self.btn_messages_label} ({self.unread})'
             self.btn_messages.config(text=label)
-        self._log_add_text(msg)
+        self._log_add_text('\n'.join(messages))
@@ -17,15 +17,15 @@
 #
 # For further info, check  http://pygubu.web.here
 
-import argparse
 import importlib
 import logging
-import platform
+import operator
+import os
 import sys
+import threading
 import tkinter as tk
-import webbrowser
 from pathlib import Path
-from tkinter import filedialog, messagebox, ttk
+from tkinter import ttk
 
 import pygubu
 from pygubu import builder
@@ -34,7 +34,6 @@ from pygubu.stockimage import StockImage, StockImageException
 import pygubudesigner
 import pygubudesigner.actions as actions
 from pygubudesigner import preferences as pref
-from pygubudesigner.codegen import ScriptGenerator
 from pygubudesigner.dialogs import AskSaveChangesDialog, ask_save_changes
 from pygubudesigner.widgets.componentpalette import ComponentPalette
 from pygubudesigner.widgets.toolbarframe import ToolbarFrame
@@ -44,8 +43,8 @@ from .logpanel import LogPanelManager
 from .preview import PreviewHelper
 from .rfilemanager import RecentFilesManager
 from .uitreeeditor import WidgetsTreeEditor
-from .util import get_ttk_style, menu_iter_children, virtual_event
-from .util.keyboard import Key, key_bind
+from .util import get_ttk_style, virtual_event
+from .util.keyboard import Key, key_dispatcher
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -55,25 +54,63 @@ logger = logging.getLogger(__name__)
 _ = translator
 
 
-def init_pygubu_widgets():
-    import pkgutil
+def _cached_import(name):
+    """Return module name, without going through the import
+    machinery if it is already imported."""
+    module = sys.modules.get(name)
+    if module is None:
+        module = importlib.import_module(name)
+    return module
+
+
+# Directories of custom widgets already added to sys.path
+_custom_widgets_dirs = set()
 
+
+def init_builtin_widgets():
     # initialize standard ttk widgets
     import pygubu.builder.ttkstdwidgets
 
-    # initialize extra widgets
+
+def extra_widget_modules():
+    """Return the names of the pygubu extra widget modules.
+
+    The modules are listed only, not imported."""
+    import pkgutil
+
     widgets_pkg = 'pygubu.builder.widgets'
-    mwidgets = importlib.import_module(widgets_pkg)
+    mwidgets = _cached_import(widgets_pkg)
+    return [
+        modulename
+        for __, modulename, __ in pkgutil.iter_modules(
+            mwidgets.__path__, mwidgets.__name__ + "."
+        )
+    ]
 
-    for __, modulename, __ in pkgutil.iter_modules(
-        mwidgets.__path__, mwidgets.__name__ + "."
-    ):
-        try:
-            importlib.import_module(modulename)
-        except Exception as e:
-            logger.exception(e)
-            msg = _(f"Failed to load widget module: '{modulename}'")
-            messagebox.showerror(_('Error'), msg)
+
+def load_widget_module(modulename):
+    try:
+        _cached_import(modulename)
+    except Exception as e:
+        from tkinter import messagebox
+
+        logger.exception(e)
+        msg = _(f"Failed to load widget module: '{modulename}'")
+        messagebox.showerror(_('Error'), msg)
+
+
+def init_extra_widgets(modules=None):
+    """Load extra, custom and plugin widgets.
+
+    :param modules: extra widget modules to load, defaults to all the
+        modules returned by extra_widget_modules()."""
+    from tkinter import messagebox
+
+    # initialize extra widgets
+    if modules is None:
+        modules = extra_widget_modules()
+    for modulename in modules:
+        load_widget_module(modulename)
 
     # initialize custom widgets
     for path in map(Path, pref.get_custom_widgets()):
@@ -82,9 +119,13 @@ def init_pygubu_widgets():
 
         dirname = str(path.parent)
         modulename = path.name[:-3]
-        if dirname not in sys.path:
-            sys.path.append(dirname)
+        if dirname not in _custom_widgets_dirs:
+            _custom_widgets_dirs.add(dirname)
+            if dirname not in sys.path:
+                sys.path.append(dirname)
 
+        if modulename in sys.modules:
+            continue
         try:
             importlib.import_module(modulename)
         except Exception as e:
@@ -93,12 +134,62 @@ def init_pygubu_widgets():
             messagebox.showerror(_("Error"), msg)
 
     # initialize custom widget plugins
-    for finder, name, ispkg in pkgutil.iter_modules():
-        if name.startswith('pygubu_'):
-            # TODO: Define how the plugins will expose all builders
-            #       to the designer.
-            plugin_builders = f'{name}.builders'
-            importlib.import_module(plugin_builders)
+    load_plugin_builders()
+
+
+# Entry point group used by plugins to expose their builders module.
+# Example, in the plugin pyproject.toml:
+#
+#   [project.entry-points."pygubu.builders"]
+#   myplugin = "pygubu_myplugin.builders"
+#
+# Deprecated: pygubu_* packages that do not declare this entry point are
+# only found on Python < 3.8, where entry points are not available.
+PLUGIN_BUILDERS_GROUP = 'pygubu.builders'
+_plugin_builders = None
+
+
+def _plugin_builders_names():
+    """Return the names of the plugin builders modules to load."""
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        # Python < 3.8, legacy scan of the pygubu_* packages.
+        import pkgutil
+
+        return [
+            f'{name}.builders'
+            for __, name, __ in pkgutil.iter_modules()
+            if name.startswith('pygubu_')
+        ]
+    eps = entry_points()
+    if hasattr(eps, 'select'):
+        eps = eps.select(group=PLUGIN_BUILDERS_GROUP)
+    else:
+        eps = eps.get(PLUGIN_BUILDERS_GROUP, [])
+    # The entry point value is the builders module name.
+    return [ep.value.split(':')[0].strip() for ep in eps]
+
+
+def load_plugin_builders():
+    """Load the builders modules exposed by installed plugins.
+
+    Plugins declare their builders module in the PLUGIN_BUILDERS_GROUP
+    entry point group.
+    Modules are loaded only once, the result is cached."""
+    global _plugin_builders
+    if _plugin_builders is None:
+        _plugin_builders = []
+        for modulename in _plugin_builders_names():
+            try:
+                _plugin_builders.append(importlib.import_module(modulename))
+            except Exception as e:
+                from tkinter import messagebox
+
+                logger.exception(e)
+                msg = _(f"Failed to load plugin builders: '{modulename}'")
+                messagebox.showerror(_('Error'), msg)
+    return _plugin_builders
 
 
 # Initialize images
@@ -113,11 +204,79 @@ IMAGE_PATHS = [  # (dir, tag)
     (IMAGES_DIR, ''),
     (IMAGES_DIR / imgformat, ''),
     (IMAGES_DIR / imgformat / 'widgets' / '22x22', '22x22-'),
-    (IMAGES_DIR / imgformat / 'widgets' / '16x16', '16x16-'),
     (IMAGES_DIR / imgformat / 'widgets' / 'fontentry', ''),
 ]
-for dir_, prefix in IMAGE_PATHS:
-    StockImage.register_from_dir(str(dir_), prefix)
+# Images used only by the widget tree, registered when the app is idle.
+TREE_IMAGE_PATHS = [
+    (IMAGES_DIR / imgformat / 'widgets' / '16x16', '16x16-'),
+]
+
+
+_registered_image_dirs = set()
+
+
+def register_stock_images(paths=IMAGE_PATHS):
+    """Register designer images.
+
+    Only image paths are registered here, tk images are created
+    on first use. Each directory is registered only once."""
+    for dir_, prefix in paths:
+        if dir_ not in _registered_image_dirs:
+            StockImage.register_from_dir(str(dir_), prefix)
+            _registered_image_dirs.add(dir_)
+
+
+def _preload_resources():
+    """Ask the OS to read ahead the designer image and ui files.
+
+    Runs in a background thread, so on a cold start disk reads overlap
+    with the gui creation."""
+    dirs = [dir_ for dir_, __ in IMAGE_PATHS + TREE_IMAGE_PATHS]
+    dirs.append(DESIGNER_DIR / 'ui')
+    fadvise = getattr(os, 'posix_fadvise', None)
+    for dir_ in dirs:
+        try:
+            entries = list(os.scandir(dir_))
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if not entry.is_file():
+                    continue
+                with open(entry.path, 'rb') as f:
+                    if fadvise is not None:
+                        fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                    else:
+                        f.read()
+            except OSError:
+                pass
+
+
+# Tcl procedure used in macOS to rewrite the accelerators of a menu
+# and all its submenus in one call.
+TCL_FIX_MAC_ACCELERATORS = '''
+proc pygubudesigner_fix_accelerators {m} {
+    set last [$m index end]
+    if {$last eq "none"} {
+        return
+    }
+    for {set i 0} {$i <= $last} {incr i} {
+        set itemtype [$m type $i]
+        if {$itemtype in {separator tearoff}} {
+            continue
+        }
+        set accel [$m entrycget $i -accelerator]
+        set accel [string map {Ctrl+ Cmd- Alt+ Ctrl+} $accel]
+        $m entryconfigure $i -accelerator $accel
+        if {$itemtype eq "cascade"} {
+            set submenu [$m entrycget $i -menu]
+            if {$submenu ne ""} {
+                pygubudesigner_fix_accelerators $submenu
+            }
+        }
+    }
+}
+'''
 
 
 class StatusBarHandler(logging.Handler):
@@ -142,25 +301,61 @@ class StatusBarHandler(logging.Handler):
 class PygubuDesigner:
     """Main gui class"""
 
+    TREE_KEYS_BINDTAG = 'PygubuDesignerTreeKeys'
+    PALETTE_ROOT_TAGS = frozenset(('tk', 'ttk'))
+
+    # Application wide shortcuts.
+    # (key, virtual event) for Control + key
+    GLOBAL_CONTROL_KEYS = (
+        (Key.N, actions.FILE_NEW),
+        (Key.O, actions.FILE_OPEN),
+        (Key.S, actions.FILE_SAVE),
+        (Key.Q, actions.FILE_QUIT),
+    )
+    # (sequence, virtual event)
+    GLOBAL_KEYS = (
+        ('<F5>', actions.TREE_ITEM_PREVIEW_TOPLEVEL),
+        ('<F6>', actions.PREVIEW_TOPLEVEL_CLOSE_ALL),
+    )
+
+    # (virtual event, handler method name)
+    ACTION_BINDINGS = (
+        (actions.FILE_NEW, 'on_file_new'),
+        (actions.FILE_OPEN, 'on_file_open'),
+        (actions.FILE_SAVE, 'on_file_save'),
+        (actions.FILE_SAVEAS, 'on_file_saveas'),
+        (actions.FILE_QUIT, 'quit'),
+        (actions.FILE_RECENT_CLEAR, 'on_file_recent_clear'),
+        # On preferences save binding
+        ('<<PygubuDesignerPreferencesSaved>>', 'on_preferences_saved'),
+    )
+
     def __init__(self):
-        """Creates all gui widgets"""
+        """Setup designer state, the gui is created in run()"""
 
         self.translator = translator
         self.preview = None
         self.about_dialog = None
         self.preferences = None
-        self.script_generator = None
+        self._script_generator = None
         self.builder = pygubu.Builder(translator)
         self.currentfile = None
         self.is_changed = False
         self.current_title = 'new'
+        self.mainwindow = None
 
+    def _create_ui(self):
+        """Creates all gui widgets"""
+
+        threading.Thread(target=_preload_resources, daemon=True).start()
+        register_stock_images()
         self.builder.add_from_file(str(DESIGNER_DIR / "ui" / "pygubu-ui.ui"))
         self.builder.add_resource_path(str(DESIGNER_DIR / "images"))
 
         in_macos = sys.platform == 'darwin'
         # build main ui
         self.mainwindow = self.builder.get_object('mainwindow')
+        self._style = get_ttk_style()
         self.main_menu = self.builder.get_object('mainmenu', self.mainwindow)
         self.context_menu = self.builder.get_object('context_menu', self.mainwindow)
 
@@ -218,29 +413,39 @@ class PygubuDesigner:
 
         # App config
         top = self.mainwindow
-        try:
-            top.wm_iconname('pygubu')
-            top.tk.call('wm', 'iconphoto', '.', StockImage.get('pygubu'))
-        except StockImageException as e:
-            pass
+        top.wm_iconname('pygubu')
+        # The icon image is not needed for the first paint
+        top.after_idle(self._set_app_icon)
 
-        # Load all widgets before creating the component pallete
-        init_pygubu_widgets()
+        # Load only the standard widgets before creating the component
+        # pallete, the rest is loaded when the main window is idle.
+        init_builtin_widgets()
+        self._extra_widgets_loaded = False
+        self._pending_widget_modules = extra_widget_modules()
+        self.mainwindow.after_idle(register_stock_images, TREE_IMAGE_PATHS)
 
         # _pallete
         self.fpalette = self.builder.get_object('fpalette')
         self.create_component_palette(self.fpalette)
+        self.mainwindow.after_idle(self._load_next_widget_module)
 
         # tree editor
         self.tree_editor = WidgetsTreeEditor(self)
 
-        # Tab Code
-        self.script_generator = ScriptGenerator(self)
-
         # App bindings
         self._setup_app_bindings()
 
-    def run(self):
+    def _set_app_icon(self):
+        try:
+            self.mainwindow.tk.call('wm', 'iconphoto', '.', StockImage.get('pygubu'))
+        except StockImageException as e:
+            pass
+
+    def run(self, filename=None):
+        if self.mainwindow is None:
+            self._create_ui()
+        if filename is not None:
+            self.load_file(filename)
         self.mainwindow.protocol("WM_DELETE_WINDOW", self.__on_window_close)
         self.mainwindow.mainloop()
 
@@ -250,7 +455,7 @@ class PygubuDesigner:
             self.mainwindow.withdraw()
             self.mainwindow.destroy()
 
-    def quit(self):
+    def quit(self, event=None):
         """Exit the app if it is ready for quit."""
         self.__on_window_close()
 
@@ -282,113 +487,67 @@ class PygubuDesigner:
             CONTROL_KP_SEQUENCE = '<Command-KeyPress>'
             ALT_KP_SEQUENCE = '<Control-KeyPress>'
             # Fix menu accelerators
-            for m, itemtype, index in menu_iter_children(self.main_menu):
-                if itemtype != 'separator':
-                    accel = m.entrycget(index, 'accelerator')
-                    accel = accel.replace('Ctrl+', 'Cmd-')
-                    accel = accel.replace('Alt+', 'Ctrl+')
-                    m.entryconfigure(index, accelerator=accel)
+            master = self.mainwindow
+            master.tk.eval(TCL_FIX_MAC_ACCELERATORS)
+            master.tk.call('pygubudesigner_fix_accelerators', str(self.main_menu))
 
         master = self.mainwindow
-        master.bind_all(
-            CONTROL_KP_SEQUENCE, key_bind(Key.N, virtual_event(actions.FILE_NEW))
-        )
         master.bind_all(
             CONTROL_KP_SEQUENCE,
-            key_bind(Key.O, virtual_event(actions.FILE_OPEN)),
-            add=True,
+            key_dispatcher(
+                [(key, virtual_event(event)) for key, event in self.GLOBAL_CONTROL_KEYS]
+            ),
         )
-        master.bind_all(
-            CONTROL_KP_SEQUENCE,
-            key_bind(Key.S, virtual_event(actions.FILE_SAVE)),
-            add=True,
-        )
-        master.bind_all(
-            CONTROL_KP_SEQUENCE,
-            key_bind(Key.Q, virtual_event(actions.FILE_QUIT)),
-            add=True,
-        )
-        master.bind_all('<F5>', virtual_event(actions.TREE_ITEM_PREVIEW_TOPLEVEL))
-        master.bind_all('<F6>', virtual_event(actions.PREVIEW_TOPLEVEL_CLOSE_ALL))
+        for sequence, event in self.GLOBAL_KEYS:
+            master.bind_all(sequence, virtual_event(event))
 
         # Tree Editing Keyboard events
-        for widget in (self.treeview, self.preview_canvas):
-            widget.bind(
-                CONTROL_KP_SEQUENCE,
-                key_bind(Key.I, virtual_event(actions.TREE_ITEM_MOVE_UP)),
-            )
-            widget.bind(
-                CONTROL_KP_SEQUENCE,
-                key_bind(Key.K, virtual_event(actions.TREE_ITEM_MOVE_DOWN)),
-                add=True,
-            )
-            widget.bind(
-                CONTROL_KP_SEQUENCE,
-                key_bind(Key.C, lambda e: self.tree_editor.copy_to_clipboard()),
-                add=True,
-            )
-            widget.bind(
-                CONTROL_KP_SEQUENCE,
-                key_bind(Key.V, lambda e: self.tree_editor.paste_from_clipboard()),
-                add=True,
-            )
-            widget.bind(
-                CONTROL_KP_SEQUENCE,
-                key_bind(Key.D, virtual_event(actions.TREE_ITEM_DUPLICATE)),
-                add=True,
-            )
-            widget.bind(
-                CONTROL_KP_SEQUENCE,
-                key_bind(Key.X, lambda e: self.tree_editor.cut_to_clipboard()),
-                add=True,
-            )
-            widget.bind(
-                '<KeyPress>', key_bind(Key.I, virtual_event(actions.TREE_NAV_UP))
-            )
-            widget.bind(
-                '<KeyPress>',
-                key_bind(Key.K, virtual_event(actions.TREE_NAV_DOWN)),
-                add=True,
-            )
-            widget.bind('<KeyPress-Delete>', virtual_event(actions.TREE_ITEM_DELETE))
-
-            # grid move bindings
-            widget.bind(
-                ALT_KP_SEQUENCE,
-                key_bind(Key.I, virtual_event(actions.TREE_ITEM_GRID_UP)),
-            )
-            widget.bind(
-                ALT_KP_SEQUENCE,
-                key_bind(Key.K, virtual_event(actions.TREE_ITEM_GRID_DOWN)),
-                add=True,
+        control_kp_handler = key_dispatcher(
+            (
+                (Key.I, virtual_event(actions.TREE_ITEM_MOVE_UP)),
+                (Key.K, virtual_event(actions.TREE_ITEM_MOVE_DOWN)),
+                (Key.C, lambda e: self.tree_editor.copy_to_clipboard()),
+                (Key.V, lambda e: self.tree_editor.paste_from_clipboard()),
+                (Key.D, virtual_event(actions.TREE_ITEM_DUPLICATE)),
+                (Key.X, lambda e: self.tree_editor.cut_to_clipboard()),
             )
-            widget.bind(
-                ALT_KP_SEQUENCE,
-                key_bind(Key.J, virtual_event(actions.TREE_ITEM_GRID_LEFT)),
-                add=True,
+        )
+        kp_handler = key_dispatcher(
+            (
+                (Key.I, virtual_event(actions.TREE_NAV_UP)),
+                (Key.K, virtual_event(actions.TREE_NAV_DOWN)),
             )
-            widget.bind(
-                ALT_KP_SEQUENCE,
-                key_bind(Key.L, virtual_event(actions.TREE_ITEM_GRID_RIGHT)),
-                add=True,
+        )
+        # grid move bindings
+        alt_kp_handler = key_dispatcher(
+            (
+                (Key.I, virtual_event(actions.TREE_ITEM_GRID_UP)),
+                (Key.K, virtual_event(actions.TREE_ITEM_GRID_DOWN)),
+                (Key.J, virtual_event(actions.TREE_ITEM_GRID_LEFT)),
+                (Key.L, virtual_event(actions.TREE_ITEM_GRID_RIGHT)),
             )
+        )
+        # Editing widgets share the bindings through a custom bindtag
+        tag = self.TREE_KEYS_BINDTAG
+        for widget in (self.treeview, self.preview_canvas):
+            widget.bindtags((tag,) + widget.bindtags())
+        master.bind_class(tag, CONTROL_KP_SEQUENCE, control_kp_handler)
+        master.bind_class(tag, '<KeyPress>', kp_handler)
+        master.bind_class(
+            tag, '<KeyPress-Delete>', virtual_event(actions.TREE_ITEM_DELETE)
+        )
+        master.bind_class(tag, ALT_KP_SEQUENCE, alt_kp_handler)
 
         # Actions Bindings
         w = self.mainwindow
-        w.bind(actions.FILE_NEW, self.on_file_new)
-        w.bind(actions.FILE_OPEN, lambda e: self.do_file_open())
-        w.bind(actions.FILE_SAVE, self.on_file_save)
-        w.bind(actions.FILE_SAVEAS, lambda e: self.do_save_as())
-        w.bind(actions.FILE_QUIT, lambda e: self.quit())
-        w.bind(actions.FILE_RECENT_CLEAR, lambda e: self.rfiles_manager.clear())
-        # On preferences save binding
-        w.bind('<<PygubuDesignerPreferencesSaved>>', self.on_preferences_saved)
+        for sequence, method_name in self.ACTION_BINDINGS:
+            w.bind(sequence, getattr(self, method_name))
 
     def _setup_styles(self):
         self.mainwindow.option_add('*Dialog.msg.width', 34)
         self.mainwindow.option_add("*Dialog.msg.wrapLength", "6i")
 
-        s = get_ttk_style()
+        s = self._style
         s.configure('ColorSelectorButton.Toolbutton', image=StockImage.get('mglass'))
         s.configure('ImageSelectorButton.Toolbutton', image=StockImage.get('mglass'))
         s.configure('ComponentPalette.Toolbutton', font='TkSmallCaptionFont')
@@ -405,26 +564,33 @@ class PygubuDesigner:
         s.configure(ToolbarFrame.BTN_RIGHT_STYLE, image=StockImage.get('arrow-right2'))
         if sys.platform == 'linux':
             # change background of comboboxes
-            color = s.lookup('TEntry', 'fieldbackground')
-            s.map('TCombobox', fieldbackground=[('readonly', color)])
-            s.map('TSpinbox', fieldbackground=[('readonly', color)])
+            readonly_bg = [('readonly', s.lookup('TEntry', 'fieldbackground'))]
+            for stylename in ('TCombobox', 'TSpinbox'):
+                s.map(stylename, fieldbackground=readonly_bg)
 
     def _setup_theme_menu(self):
-        menu = self.builder.get_object('preview_themes_submenu')
-        s = get_ttk_style()
-        styles = sorted(s.theme_names())
         self.__theme_var = var = tk.StringVar()
         theme = pref.get_option('ttk_theme')
         var.set(theme)
 
-        for name in styles:
+        # Theme entries are created the first time the menu is posted.
+        menu = self.builder.get_object('preview_themes_submenu')
+        menu.configure(postcommand=self._populate_theme_menu)
 
-            def handler(theme=name):
-                self._change_ttk_theme(theme)
+    def _populate_theme_menu(self):
+        menu = self.builder.get_object('preview_themes_submenu')
+        menu.configure(postcommand='')
+        styles = sorted(self._style.theme_names())
+        var = self.__theme_var
 
-            menu.add_radiobutton(
-                label=name, value=name, variable=self.__theme_var, command=handler
-            )
+        # All entries share one tcl command, the selected theme is
+        # read back from the menu variable.
+        command = menu.register(self._on_theme_menu_select)
+        for name in styles:
+            menu.add_radiobutton(label=name, value=name, variable=var, command=command)
+
+    def _on_theme_menu_select(self):
+        self._change_ttk_theme(self.__theme_var.get())
 
     def _should_center_preview_window(self) -> bool:
         """
@@ -439,59 +605,49 @@ class PygubuDesigner:
             return False
 
     def create_treelist(self):
-        root_tagset = {'tk', 'ttk'}
-
-        # create unique tag set
-        tagset = set()
-        for c in builder.CLASS_MAP.keys():
-            wc = builder.CLASS_MAP[c]
-            tagset.update(wc.tags)
-        tagset.difference_update(root_tagset)
-
-        treelist = []
-        for c in builder.CLASS_MAP.keys():
-            wc = builder.CLASS_MAP[c]
-            ctags = set(wc.tags)
-            roots = root_tagset & ctags
-            sections = tagset & ctags
+        root_tagset = self.PALETTE_ROOT_TAGS
+
+        # Sections are the widget tags that are not a root tag.
+        # The sort key is computed once per entry.
+        entries = []
+        for wc in builder.CLASS_MAP.values():
+            roots = [t for t in wc.tags if t in root_tagset]
+            sections = [t for t in wc.tags if t not in root_tagset]
             for r in roots:
                 for s in sections:
-                    key = f'{r}>{s}'
-                    treelist.append((key, wc))
+                    entries.append(((r, s, wc.label), r, s, wc))
 
         # sort tags by label
-        def by_label(t):
-            return f"{t[0]}{t[1].label}"
-
-        treelist.sort(key=by_label)
+        entries.sort(key=operator.itemgetter(0))
+        treelist = [(r, s, wc) for __, r, s, wc in entries]
         return treelist
 
     def create_component_palette(self, fpalette):
+        self._pallete = ComponentPalette(fpalette)
+        self.rebuild_component_palette()
+
+    def rebuild_component_palette(self):
         # Default widget image:
         default_image = ''
-        try:
+        if StockImage.is_registered('22x22-tk.default'):
             default_image = StockImage.get('22x22-tk.default')
-        except StockImageException as e:
-            pass
 
         treelist = self.create_treelist()
-        self._pallete = ComponentPalette(fpalette)
+        self._pallete.clear()
 
         # Start building widget tree selector
         roots = {}
         sections = {}
-        for key, wc in treelist:
-            root, section = key.split('>')
+        for root, section, wc in treelist:
             if section not in sections:
                 roots[root] = self._pallete.add_tab(section, section)
                 sections[section] = 1
 
             # insert widget
             w_image = default_image
-            try:
-                w_image = StockImage.get(f'22x22-{wc.classname}')
-            except StockImageException as e:
-                pass
+            image_key = f'22x22-{wc.classname}'
+            if StockImage.is_registered(image_key):
+                w_image = StockImage.get(image_key)
 
             # define callback for button
             def create_cb(cname):
@@ -504,12 +660,39 @@ class PygubuDesigner:
             self._pallete.add_button(
                 section, root, wlabel, wc.classname, w_image, callback
             )
-        default_group = pref.get_option('widget_set')
-        self._pallete.show_group(default_group)
+        # Keep the group shown when the pallete is rebuilt, the
+        # preference is only the initial group.
+        group = self._pallete.gvalue.get() or pref.get_option('widget_set')
+        self._pallete.show_group(group)
+
+    def _load_next_widget_module(self):
+        """Load one extra widget module per idle call, so the main
+        window keeps processing events while the modules are loaded."""
+        if self._extra_widgets_loaded:
+            return
+        if self._pending_widget_modules:
+            load_widget_module(self._pending_widget_modules.pop(0))
+            self.mainwindow.after_idle(self._load_next_widget_module)
+        else:
+            self.load_all_widgets()
+
+    def load_all_widgets(self):
+        """Load the extra and custom widgets not loaded yet and add
+        them to the pallete.
+
+        Called before reading xml that may use any registered class."""
+        if self._extra_widgets_loaded:
+            return
+        self._extra_widgets_loaded = True
+        register_stock_images(TREE_IMAGE_PATHS)
+        modules, self._pending_widget_modules = self._pending_widget_modules, []
+        init_extra_widgets(modules)
+        self.rebuild_component_palette()
 
     def on_add_widget_event(self, classname):
         """Adds a widget to the widget tree."""
 
+        register_stock_images(TREE_IMAGE_PATHS)
         self.tree_editor.add_widget(classname)
         self.tree_editor.treeview.focus_set()
 
@@ -522,7 +705,7 @@ class PygubuDesigner:
         self._change_ttk_theme(theme)
 
     def _change_ttk_theme(self, theme):
-        s = get_ttk_style()
+        s = self._style
         try:
             s.theme_use(theme)
             self._setup_styles()
@@ -578,10 +761,14 @@ class PygubuDesigner:
             logger.info(_('Project saved to %s'), fname)
             saved = True
         except Exception as e:
+            from tkinter import messagebox
+
             messagebox.showerror(_('Error'), str(e), parent=self.mainwindow)
         return saved
 
     def do_save_as(self):
+        from tkinter import filedialog
+
         saved = False
         options = {
             'defaultextension': '.ui',
@@ -593,8 +780,7 @@ class PygubuDesigner:
         return saved
 
     def save_file(self, filename):
-        uidefinition = self.tree_editor.tree_to_uidef()
-        uidefinition.save(filename)
+        self.tree_editor.save_file(filename)
         self.currentfile = filename
         title = self.project_name()
         self.set_title(title)
@@ -608,6 +794,8 @@ class PygubuDesigner:
     def load_file(self, filename):
         """Load xml into treeview"""
 
+        # The file may use widgets that are not loaded yet.
+        self.load_all_widgets()
         try:
             self.tree_editor.load_file(filename)
             self.currentfile = filename
@@ -616,6 +804,8 @@ class PygubuDesigner:
             self.set_changed(False)
             self.rfiles_manager.addfile(filename)
         except Exception as e:
+            from tkinter import messagebox
+
             messagebox.showerror(_('Error'), str(e), parent=self.mainwindow)
 
     def do_file_open(self, filename=None):
@@ -625,6 +815,8 @@ class PygubuDesigner:
             openfile = self.ask_save_changes(msg)
         if openfile:
             if filename is None:
+                from tkinter import filedialog
+
                 options = {
                     'defaultextension': '.ui',
                     'filetypes': ((_('pygubu ui'), '*.ui'), (_('All'), '*.*')),
@@ -644,7 +836,17 @@ class PygubuDesigner:
             self.currentfile = None
             self.set_changed(False)
             self.set_title(self.project_name())
-            self.script_generator.reset()
+            if self._script_generator is not None:
+                self._script_generator.reset()
+
+    def on_file_open(self, event=None):
+        self.do_file_open()
+
+    def on_file_saveas(self, event=None):
+        self.do_save_as()
+
+    def on_file_recent_clear(self, event=None):
+        self.rfiles_manager.clear()
 
     def on_file_save(self, event=None):
         file_saved = False
@@ -676,6 +878,8 @@ class PygubuDesigner:
     # Help menu
     def on_help_menuitem_clicked(self, itemid):
         if itemid == 'help_online':
+            import webbrowser
+
             url = 'https://github.com/alejandroautalan/pygubu-designer/wiki'
             webbrowser.open_new_tab(url)
         elif itemid == 'help_about':
@@ -772,14 +976,20 @@ class PygubuDesigner:
             dialog.close()
 
         def on_gpl3_clicked(e):
+            import webbrowser
+
             url = 'https://www.gnu.org/licenses/gpl-3.0.html'
             webbrowser.open_new_tab(url)
 
         def on_mit_clicked(e):
+            import webbrowser
+
             url = 'https://opensource.org/licenses/MIT'
             webbrowser.open_new_tab(url)
 
         def on_moreinfo_clicked(e):
+            import webbrowser
+
             url = 'https://github.com/alejandroautalan/pygubu-designer'
             webbrowser.open_new_tab(url)
 
@@ -813,6 +1023,15 @@ class PygubuDesigner:
             name = Path(self.currentfile).name
         return name
 
+    @property
+    def script_generator(self):
+        """Code tab manager, created when the code tab is first used."""
+        if self._script_generator is None:
+            from pygubudesigner.codegen import ScriptGenerator
+
+            self._script_generator = ScriptGenerator(self)
+        return self._script_generator
+
     def nbmain_tab_changed(self, event):
         if event.widget.index('current') == 1:  # Index 1 is the code-tab
             self.script_generator.configure()
@@ -849,16 +1068,20 @@ class PygubuDesigner:
 
 
 def start_pygubu():
-    print(f"python: {platform.python_version()} on {sys.platform}")
-    print(f"pygubu: {pygubu.__version__}")
-    print(f"pygubu-designer: {pygubudesigner.__version__}")
+    import argparse
+    import platform
 
-    # Setup logging level
+    # Parse arguments first, --help and invalid arguments exit here.
     parser = argparse.ArgumentParser()
     parser.add_argument('filename', nargs='?')
     parser.add_argument('--loglevel')
     args = parser.parse_args()
 
+    print(f"python: {platform.python_version()} on {sys.platform}")
+    print(f"pygubu: {pygubu.__version__}")
+    print(f"pygubu-designer: {pygubudesigner.__version__}")
+
+    # Setup logging level
     loglevel = str(args.loglevel).upper()
     loglevel = getattr(logging, loglevel, logging.WARNING)
     logging.getLogger('').setLevel(loglevel)
@@ -870,23 +1093,16 @@ def start_pygubu():
     check_dependency('appdirs', '1.3', help)
 
     app = PygubuDesigner()
-
-    filename = args.filename
-    if filename is not None:
-        app.load_file(filename)
-
-    app.run()
+    app.run(args.filename)
 
 
 def check_dependency(modulename, version, help_msg=None):
     try:
-        module = importlib.import_module(modulename)
-        module_version = "<unknown>"
-        for attr in ('version', '__version__', 'ver', 'PYQT_VERSION_STR'):
-            v = getattr(module, attr, None)
-            if v is not None:
-                break
-        logger.info(f"Module {modulename} imported ok, version {v}")
+        module = _cached_import(modulename)
+        module_version = getattr(module, '__version__', None) or getattr(
+            module, 'version', '<unknown>'
+        )
+        logger.info(f"Module {modulename} imported ok, version {module_version}")
     except ImportError as e:
         logger.error(
             f"I can't import module {modulename!r}. You need to have installed "
@@ -16,13 +16,13 @@
 import logging
 import sys
 import tkinter as tk
-import tkinter.ttk as ttk
 from collections import OrderedDict
 from functools import partial
 
 from pygubu.stockimage import StockImage
 
 import pygubudesigner.actions as actions
+from pygubudesigner.util import get_ttk_style
 from pygubudesigner.widgets.ttkstyleentry import TtkStylePropertyEditor
 
 from .preview import DialogPreview, MenuPreview, Preview, ToplevelPreview
@@ -61,7 +61,7 @@ class PreviewHelper:
         canvas.bind('<5>', lambda event: canvas.yview('scroll', 1, 'units'))
         self._create_indicators()
 
-        self.style = ttk.Style()
+        self.style = get_ttk_style()
         self.style.configure('PreviewFrame.TFrame', background='lightgreen')
 
         self.selected_widget = None
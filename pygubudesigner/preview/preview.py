@@ -20,7 +20,6 @@ import tkinter as tk
 import tkinter.ttk as ttk
 
 import pygubu
-import screeninfo
 
 from pygubudesigner.widgetdescr import WidgetMeta
 from pygubudesigner.widgets.toplevelframe import ToplevelFramePreview
@@ -222,6 +221,8 @@ class Preview:
         window.withdraw()
 
         # Get a list of monitors
+        import screeninfo
+
         monitors = screeninfo.get_monitors()
 
         mon_sizes = []
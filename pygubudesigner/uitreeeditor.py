@@ -12,18 +12,19 @@
 #
 # You should have received a copy of the GNU General Public License along
 # with this program.  If not, see <http://www.gnu.org/licenses/>.
+import copy
 import json
 import logging
 import os
 import tkinter as tk
 import xml.etree.ElementTree as ET
-from collections import Counter
+from collections import namedtuple
 from functools import partial
 from tkinter import messagebox
 
 from pygubu.builder import CLASS_MAP
 from pygubu.builder.uidefinition import UIDefinition
-from pygubu.stockimage import StockImage, StockImageException
+from pygubu.stockimage import StockImage
 
 import pygubudesigner
 from pygubudesigner import preferences as pref
@@ -48,19 +49,52 @@ logger = logging.getLogger('pygubu.designer')
 # translator function
 _ = translator
 
+ValidationRules = namedtuple(
+    'ValidationRules',
+    ['allowed_children', 'children_set', 'maxchildren', 'parents_set', 'container'],
+)
+
 
 class WidgetsTreeEditor:
     GRID_UP = 0
     GRID_DOWN = 1
     GRID_LEFT = 2
     GRID_RIGHT = 3
+    # Delay in ms before filtering the tree while the user types.
+    FILTER_DELAY = 150
+    # Treeview icon by widget class name.
+    _icon_cache = {}
+    # Parent/children rules by builder class, see _validation_rules.
+    _validation_cache = {}
+    # Kinds of names that must not collide in the UI.
+    NAME_KINDS = ('id', 'tkvar', 'command', 'binding')
+    # (tkvar_properties, command_properties) by builder class.
+    _name_properties_cache = {}
 
     def __init__(self, app):
         self.app = app
         self.treeview = app.treeview
         self.previewer = app.previewer
         self.treedata = {}
-        self.counter = Counter()
+        # Tree structure kept on the python side. It includes the items
+        # hidden by the filter.
+        self._children = {'': []}
+        self._parent = {}
+        # Item of each widget data, the reverse of treedata.
+        self._data_to_item = {}
+        # XML node of each widget without its children, rebuilt only
+        # when the widget data changes.
+        self._xmlnode_cache = {}
+        # Signature of each widget data when its last change was shown,
+        # see _data_signature.
+        self._data_signature_cache = {}
+        # Grid dimension of the children of each container item.
+        self._grid_dim_cache = {}
+        self.counter = {}
+        # Names defined by each item and how many items define each name,
+        # by kind of name (see _widget_names).
+        self._item_names = {}
+        self._used_names = {kind: {} for kind in self.NAME_KINDS}
         self.virtual_clipboard_for_duplicate = None
         self.duplicating = False
         self.duplicate_parent_iid = None
@@ -85,6 +119,10 @@ class WidgetsTreeEditor:
         self.filter_btn = app.builder.get_object('filterclear_btn')
         self.filter_prev_value = ''
         self.filter_prev_sitem = None
+        # Nesting level of filter_remove(remember=True) calls, only the
+        # outermost filter_restore applies the filter again.
+        self._filter_suspended = 0
+        self._filter_after_id = None
         self._detached = []
         self._listen_object_updates = True
 
@@ -170,9 +208,8 @@ class WidgetsTreeEditor:
         their geometry managers changed inside a container widget.
         """
         if self.current_edit:
-            values = self.treeview.item(self.current_edit, 'values')
-            values = (values[0], '', '')
-            self.treeview.item(self.current_edit, values=values)
+            classname = self.treedata[self.current_edit].classname
+            self.treeview.item(self.current_edit, values=(classname, '', ''))
 
     def selection_different_parents(self):
         """
@@ -214,30 +251,19 @@ class WidgetsTreeEditor:
             return False
 
         # Keep a record of the selected items' parents.
-        parent_iids = []
+        parent_iids = set()
 
         # Check whether any of the selected items have a different parent or
         # not.
         for selected_item in all_selections:
+            parent_iids.add(self._parent[selected_item])
 
-            # Get the parent of the current item we are looping on
-            item_parent = self.treeview.parent(selected_item)
-
-            # If item's parents has not been recorded, record it now.
-            if item_parent not in parent_iids:
-                parent_iids.append(item_parent)
-
-                # Do we now have more than 1 parent? Break out of the loop if
-                # that's the case.
-                if len(parent_iids) > 1:
-                    item_parent_in_selection = True
-                    break
-
-        else:
-            # There are no selected items that have different parents.
-            item_parent_in_selection = False
+            # Do we now have more than 1 parent?
+            if len(parent_iids) > 1:
+                return True
 
-        return item_parent_in_selection
+        # There are no selected items that have different parents.
+        return False
 
     def on_tree_item_duplicate(self, event):
         """
@@ -255,23 +281,25 @@ class WidgetsTreeEditor:
 
         # Get the iids of all the selections. We need this to get the parent
         # iid of the first selection.
-        selected_iid = self.treeview.selection()
+        selection = self.treeview.selection()
 
-        if not selected_iid:
+        if not selection:
             return
         else:
             # Get the iid of the first selection so we can later find out its
             # parent's iid.
-            selected_iid = selected_iid[0]
+            selected_iid = selection[0]
 
-        # Set a flag to indicate to copy_to_clipboard() that we will not
+        # Set a flag to indicate to paste_from_clipboard() that we will not
         # be using the clipboard, but a variable instead.
         self.duplicating = True
-        self.copy_to_clipboard()
+        self.virtual_clipboard_for_duplicate = [
+            self._copy_item_data(item) for item in selection
+        ]
 
         # Record the selected items' parent iid (because we're going to paste
         # the widget(s) into the parent)
-        self.duplicate_parent_iid = self.treeview.parent(selected_iid)
+        self.duplicate_parent_iid = self._parent[selected_iid]
 
         # Paste the virtually-copied widget (not with the clipboard) to the
         # parent.
@@ -279,15 +307,17 @@ class WidgetsTreeEditor:
 
     def change_container_manager(self, new_manager):
         item = self.current_edit
-        parent = self.treeview.parent(item)
+        parent = self._parent[item]
         gridrow = 0
         if parent:
-            children = self.treeview.get_children(parent)
+            children = self._children[parent]
             # Stop listening object updates
             self._listen_object_updates = False
 
             # Update container manager info for parent
             self.treedata[parent].container_manager = new_manager
+            self._xmlnode_cache.pop(self.treedata[parent], None)
+            self._grid_dim_cache.pop(parent, None)
 
             # Update children
             for child in children:
@@ -298,14 +328,13 @@ class WidgetsTreeEditor:
                     widget.manager = new_manager  # Change manager
 
                     # update Tree R/C columns
-                    values = self.treeview.item(child, 'values')
                     if new_manager == 'grid':
                         widget.layout_property('row', str(gridrow))
                         widget.layout_property('column', '0')
-                        values = (values[0], gridrow, 0)
+                        values = (widget.classname, gridrow, 0)
                         gridrow += 1
                     else:
-                        values = (values[0], '', '')
+                        values = (widget.classname, '', '')
                     self.treeview.item(child, values=values)
             self._listen_object_updates = True
             self.editor_edit(item, self.treedata[item])
@@ -320,7 +349,7 @@ class WidgetsTreeEditor:
     def get_children_manager(self, parent, current_item=None):
         '''Get layout manager for children of item'''
         manager = None
-        children = self.treeview.get_children(parent)
+        children = self._children[parent]
         for child in children:
             child_manager = self.treedata[child].manager
             if child != current_item and child_manager != 'place':
@@ -331,22 +360,19 @@ class WidgetsTreeEditor:
     def get_container_info(self, item):
         '''Return children count and grid dimension if container manager
         is grid.'''
-        children = self.treeview.get_children(item)
+        children = self._children[item]
         count = len(children)
         grid_dim = None
         manager = self.get_children_manager(item)
-        max_row = 0
-        max_col = 0
         if manager == 'grid':
-            for item in children:
-                wmeta = self.treedata[item]
-                row = int(wmeta.layout_property('row'))
-                if row > max_row:
-                    max_row = row
-                col = int(wmeta.layout_property('column'))
-                if col > max_col:
-                    max_col = col
-            grid_dim = (max_row + 1, max_col + 1)
+            grid_dim = self._grid_dim_cache.get(item)
+            if grid_dim is None:
+                # There is at least one child managed by grid.
+                wmetas = [self.treedata[child] for child in children]
+                max_row = max(int(w.layout_property('row')) for w in wmetas)
+                max_col = max(int(w.layout_property('column')) for w in wmetas)
+                grid_dim = (max(max_row, 0) + 1, max(max_col, 0) + 1)
+                self._grid_dim_cache[item] = grid_dim
 
         cinfo = {
             'manager': manager,
@@ -360,7 +386,7 @@ class WidgetsTreeEditor:
         manager_options = ['grid', 'pack', 'place']
 
         # Determine allowed manager options
-        parent = self.treeview.parent(item)
+        parent = self._parent[item]
         if parent:
             cm = self.get_children_manager(parent, item)
             if 'grid' == cm:
@@ -375,6 +401,7 @@ class WidgetsTreeEditor:
         if cmanager is not None and cmanager != wdescr.container_manager:
             # Update widged description
             wdescr.container_manager = cmanager
+            self._xmlnode_cache.pop(wdescr, None)
 
         self.properties_editor.edit(wdescr)
         self.layout_editor.edit(wdescr, manager_options, cinfo)
@@ -386,16 +413,28 @@ class WidgetsTreeEditor:
         self.bindings_editor.hide_all()
 
     def config_filter(self):
-        def on_filtervar_changed(varname, element, mode):
-            self.filter_by(self.filtervar.get())
-
-        self.filtervar.trace('w', on_filtervar_changed)
+        self.filtervar.trace_add('write', self._on_filtervar_changed)
 
         def on_filterbtn_click():
             self.filtervar.set('')
 
         self.filter_btn.configure(command=on_filterbtn_click)
 
+    def _on_filtervar_changed(self, varname, element, mode):
+        self._cancel_pending_filter()
+        self._filter_after_id = self.treeview.after(
+            self.FILTER_DELAY, self._apply_pending_filter
+        )
+
+    def _apply_pending_filter(self):
+        self._filter_after_id = None
+        self.filter_by(self.filtervar.get())
+
+    def _cancel_pending_filter(self):
+        if self._filter_after_id is not None:
+            self.treeview.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+
     def config_treeview(self):
         """Sets treeview columns and other params"""
         tree = self.treeview
@@ -404,12 +443,11 @@ class WidgetsTreeEditor:
 
     def get_toplevel_parent(self, treeitem):
         """Returns the top level parent for treeitem."""
-        tv = self.treeview
-        toplevel_items = tv.get_children()
-
         item = treeitem
-        while not (item in toplevel_items):
-            item = tv.parent(item)
+        parent = self._parent[item]
+        while parent != '':
+            item = parent
+            parent = self._parent[item]
 
         return item
 
@@ -417,8 +455,6 @@ class WidgetsTreeEditor:
         """Create a preview of the selected treeview item"""
 
         if item:
-            self.filter_remove(remember=True)
-
             selected_id = self.treedata[item].identifier
             item = self.get_toplevel_parent(item)
             widget_id = self.treedata[item].identifier
@@ -426,19 +462,16 @@ class WidgetsTreeEditor:
             uidef = self.tree_to_uidef(item)
             self.previewer.draw(item, widget_id, uidef, wclass)
             self.previewer.show_selected(item, selected_id)
-            self.filter_restore()
 
     def on_preview_in_toplevel(self, event=None):
         tv = self.treeview
         sel = tv.selection()
         if sel:
-            self.filter_remove(remember=True)
             item = sel[0]
             item = self.get_toplevel_parent(item)
             widget_id = self.treedata[item].identifier
             uidef = self.tree_to_uidef(item)
             self.previewer.preview_in_toplevel(item, widget_id, uidef)
-            self.filter_restore()
         else:
             logger.warning(_('No item selected.'))
 
@@ -448,7 +481,7 @@ class WidgetsTreeEditor:
         # toplevel_items = tv.get_children()
         if sel:
             item = sel[0]
-            if tv.parent(item) == '':
+            if self._parent[item] == '':
                 # only redraw if toplevel is double clicked
                 self.draw_widget(item)
 
@@ -460,71 +493,81 @@ class WidgetsTreeEditor:
 
         # Need to remove filter
         self.filter_remove(remember=True)
+        try:
+            parents_to_redraw = set()
+            final_focus = None
+            for item in selection:
+                if item not in self.treedata:
+                    # Already removed with a selected ancestor
+                    continue
+                try:
+                    parent = ''
+                    item_parent = self._parent[item]
+                    if item_parent != '':
+                        parent = self.get_toplevel_parent(item)
+                    else:
+                        self.previewer.delete(item)
+                    # determine final focus
+                    if final_focus is None:
+                        candidates = (tv.prev(item), tv.next(item), tv.parent(item))
+                        for c in candidates:
+                            if c and (c not in selection):
+                                final_focus = c
+                                break
+                    # remove item and all its descendants
+                    self._children[item_parent].remove(item)
+                    self._grid_dim_cache.pop(item_parent, None)
+                    self.delete_item_data(item)
+                    tv.delete(item)
+                    self.app.set_changed()
+                    if parent and (parent not in selection):
+                        parents_to_redraw.add(parent)
+                    self.editor_hide_all()
+                except tk.TclError:
+                    # Selection of parent and child items ??
+                    # TODO: notify something here
+                    pass
+            # redraw widgets
+            for item in parents_to_redraw:
+                self.draw_widget(item)
+            # Set final item focused
+            if final_focus:
+                selected_id = self.treedata[final_focus].identifier
 
-        toplevel_items = tv.get_children()
-        parents_to_redraw = set()
-        final_focus = None
-        for item in selection:
-            try:
-                parent = ''
-                if item not in toplevel_items:
-                    parent = self.get_toplevel_parent(item)
-                else:
-                    self.previewer.delete(item)
-                # determine final focus
-                if final_focus is None:
-                    candidates = (tv.prev(item), tv.next(item), tv.parent(item))
-                    for c in candidates:
-                        if c and (c not in selection):
-                            final_focus = c
-                            break
-                # remove item and all its descendants
-                self.delete_item_data(item)
-                tv.delete(item)
-                self.app.set_changed()
-                if parent and (parent not in selection):
-                    parents_to_redraw.add(parent)
-                self.editor_hide_all()
-            except tk.TclError:
-                # Selection of parent and child items ??
-                # TODO: notify something here
-                pass
-        # redraw widgets
-        for item in parents_to_redraw:
-            self.draw_widget(item)
-        # Set final item focused
-        if final_focus:
-            selected_id = self.treedata[final_focus].identifier
-            tv.after_idle(lambda: tv.selection_set(final_focus))
-            tv.after_idle(lambda: tv.focus(final_focus))
-            tv.after_idle(lambda: tv.see(final_focus))
-            tv.after_idle(
-                lambda i=final_focus, s=selected_id: self.previewer.show_selected(i, s)
-            )
+                def focus_item(item=final_focus, selected_id=selected_id):
+                    self._focus_item(item)
+                    self.previewer.show_selected(item, selected_id)
 
-        # No widget/item is currently selected anymore because
-        # we've just deleted selected items from the treeview.
-        self.current_edit = None
+                tv.after_idle(focus_item)
 
-        # restore filter
-        self.filter_restore()
+            # No widget/item is currently selected anymore because
+            # we've just deleted selected items from the treeview.
+            self.current_edit = None
+        finally:
+            # restore filter
+            self.filter_restore()
 
     def delete_item_data(self, item):
         """
         Delete the item and all its descendants from self.treedata
+        and from the tree structure.
 
         Arguments:
 
         - item: the item iid (str) to delete, such as 'I001'
         """
 
-        # Get the children of the item.
-        item_children = self.treeview.get_children(item)
-
-        for child in item_children:
-            self.delete_item_data(child)
-
-        del self.treedata[item]
+        stack = [item]
+        while stack:
+            current = stack.pop()
+            stack.extend(self._children.pop(current))
+            del self._parent[current]
+            self._grid_dim_cache.pop(current, None)
+            self._remove_item_names(current)
+            data = self.treedata.pop(current)
+            del self._data_to_item[data]
+            self._xmlnode_cache.pop(data, None)
+            self._data_signature_cache.pop(data, None)
 
     def new_uidefinition(self):
         author = f'PygubuDesigner {pygubudesigner.__version__}'
@@ -532,15 +575,24 @@ class WidgetsTreeEditor:
         uidef.author = author
         return uidef
 
+    def save_file(self, file_or_filename):
+        """Save the ui definition of the whole tree."""
+
+        uidef = self.tree_to_uidef()
+        # Saving indents the xml in place, indent a copy so the cached
+        # widget nodes are not changed.
+        uidef.root = copy.deepcopy(uidef.root)
+        uidef.tree = ET.ElementTree(uidef.root)
+        uidef.save(file_or_filename)
+
     def tree_to_uidef(self, treeitem=None):
         """Traverses treeview and generates a ElementTree object"""
 
-        # Need to remove filter or hidden items will not be saved.
-        self.filter_remove(remember=True)
-
+        # The tree structure is read from self._children, which includes
+        # the items hidden by the filter.
         uidef = self.new_uidefinition()
         if treeitem is None:
-            items = self.treeview.get_children()
+            items = self._children['']
             for item in items:
                 node = self.build_uidefinition(uidef, '', item)
                 uidef.add_xmlnode(node)
@@ -548,20 +600,33 @@ class WidgetsTreeEditor:
             node = self.build_uidefinition(uidef, '', treeitem)
             uidef.add_xmlnode(node)
 
-        # restore filter
-        self.filter_restore()
-
         return uidef
 
     def build_uidefinition(self, uidef, parent, item):
         """Traverses tree and build ui definition"""
 
-        node = uidef.widget_to_xmlnode(self.treedata[item])
-
-        children = self.treeview.get_children(item)
-        for child in children:
-            child_node = self.build_uidefinition(uidef, item, child)
-            uidef.add_xmlchild(node, child_node)
+        root_node = self._widget_xmlnode(uidef, self.treedata[item])
+
+        stack = [(root_node, item)]
+        while stack:
+            node, current = stack.pop()
+            for child in self._children[current]:
+                child_node = self._widget_xmlnode(uidef, self.treedata[child])
+                uidef.add_xmlchild(node, child_node)
+                stack.append((child_node, child))
+        return root_node
+
+    def _widget_xmlnode(self, uidef, data):
+        """Return a new xml node for data, reusing the cached one."""
+
+        cached = self._xmlnode_cache.get(data)
+        if cached is None:
+            cached = uidef.widget_to_xmlnode(data)
+            self._xmlnode_cache[data] = cached
+        # The uidefinition appends the children to the node, hand out a
+        # new node that shares the property, layout and bind elements.
+        node = ET.Element(cached.tag, cached.attrib)
+        node.extend(cached)
         return node
 
     def _insert_item(self, root, data, from_file=False, is_first_widget_pasted=False):
@@ -599,28 +664,36 @@ class WidgetsTreeEditor:
 
                     data.layout_property('row', row)
 
-        image = ''
-        try:
-            image = StockImage.get('16x16-tk.default')
-        except StockImageException:
-            # TODO: notify something here
-            pass
-
-        try:
-            image = StockImage.get(f'16x16-{data.classname}')
-        except StockImageException:
-            # TODO: notify something here
-            pass
-
+        image = self._get_icon(data.classname)
         values = (data.classname, row, col)
         item = tree.insert(root, 'end', text=treelabel, values=values, image=image)
         data.attach(self)
         self.treedata[item] = data
+        self._data_to_item[data] = item
+        self._children[item] = []
+        self._children[root].append(item)
+        self._parent[item] = root
+        self._grid_dim_cache.pop(root, None)
+        self._add_item_names(item, self._widget_names(data))
 
         self.app.set_changed()
 
         return item
 
+    def _get_icon(self, classname):
+        image = self._icon_cache.get(classname)
+        if image is None:
+            key = f'16x16-{classname}'
+            if StockImage.is_registered(key):
+                image = StockImage.get(key)
+                self._icon_cache[classname] = image
+            elif StockImage.is_registered('16x16-tk.default'):
+                # Not cached, the class icon may be registered later.
+                image = StockImage.get('16x16-tk.default')
+            else:
+                image = ''
+        return image
+
     def copy_to_clipboard(self):
         """
         Copies selected items to clipboard.
@@ -630,21 +703,14 @@ class WidgetsTreeEditor:
         selection = tree.selection()
         logger.debug('Selection %s', selection)
         if selection:
-            self.filter_remove(remember=True)
-
             uidef = self.new_uidefinition()
             for item in selection:
                 node = self.build_uidefinition(uidef, '', item)
                 uidef.add_xmlnode(node)
             text = str(uidef)
 
-            if self.duplicating:
-                self.virtual_clipboard_for_duplicate = text
-            else:
-                tree.clipboard_clear()
-                tree.clipboard_append(text)
-
-            self.filter_restore()
+            tree.clipboard_clear()
+            tree.clipboard_append(text)
 
     def cut_to_clipboard(self):
         self.copy_to_clipboard()
@@ -653,14 +719,14 @@ class WidgetsTreeEditor:
     def _validate_add(self, root_item, classname, show_warnings=True):
         is_valid = True
 
-        new_boclass = CLASS_MAP[classname].builder
+        new_rules = self._validation_rules(CLASS_MAP[classname].builder)
         root = root_item
         if root:
             root_classname = self.treedata[root].classname
-            root_boclass = CLASS_MAP[root_classname].builder
-            allowed_children = root_boclass.allowed_children
+            root_rules = self._validation_rules(CLASS_MAP[root_classname].builder)
+            allowed_children = root_rules.allowed_children
             if allowed_children:
-                if classname not in allowed_children:
+                if classname not in root_rules.children_set:
                     if show_warnings:
                         str_children = ', '.join(allowed_children)
                         msg = _('Allowed children: %s.')
@@ -668,8 +734,8 @@ class WidgetsTreeEditor:
                     is_valid = False
                     return is_valid
 
-            children_count = len(self.treeview.get_children(root))
-            maxchildren = root_boclass.maxchildren
+            children_count = len(self._children[root])
+            maxchildren = root_rules.maxchildren
             if maxchildren is not None and children_count >= maxchildren:
                 if show_warnings:
                     msg = trlog(
@@ -681,7 +747,7 @@ class WidgetsTreeEditor:
                 is_valid = False
                 return is_valid
 
-            allowed_parents = new_boclass.allowed_parents
+            allowed_parents = new_rules.parents_set
             if allowed_parents is not None and root_classname not in allowed_parents:
                 if show_warnings:
                     msg = trlog(
@@ -691,7 +757,7 @@ class WidgetsTreeEditor:
                 is_valid = False
                 return is_valid
 
-            if allowed_children is None and root_boclass.container is False:
+            if allowed_children is None and root_rules.container is False:
                 if show_warnings:
                     msg = _('Not allowed, %s is not a container.')
                     logger.warning(msg, root_classname)
@@ -702,7 +768,7 @@ class WidgetsTreeEditor:
             # allways show warning when inserting in top level
             # if insertion is at top level,
             # Validate if it can be added at root level
-            allowed_parents = new_boclass.allowed_parents
+            allowed_parents = new_rules.parents_set
             if allowed_parents is not None and 'root' not in allowed_parents:
                 if show_warnings:
                     msg = _('%s not allowed at root level')
@@ -713,7 +779,7 @@ class WidgetsTreeEditor:
             # if parents are not specified as parent,
             # check that item to insert is a container.
             # only containers are allowed at root level
-            if new_boclass.container is False:
+            if new_rules.container is False:
                 if show_warnings:
                     msg = _('Not allowed at root level, %s is not a container.')
                     logger.warning(msg, classname)
@@ -721,95 +787,170 @@ class WidgetsTreeEditor:
                 return is_valid
         return is_valid
 
-    def _generate_id(self, classname, index):
-        name = classname.split('.')[-1]
-
-        if pref.get_option('widget_naming_separator') == 'UNDERSCORE':
-            name = f'{name}_{index}'
-        else:
-            name = f'{name}{index}'
+    @classmethod
+    def _validation_rules(cls, boclass):
+        """Return the ValidationRules for builder class boclass."""
+        rules = cls._validation_cache.get(boclass)
+        if rules is None:
+            allowed_children = boclass.allowed_children
+            allowed_parents = boclass.allowed_parents
+            rules = ValidationRules(
+                allowed_children,
+                frozenset(allowed_children or ()),
+                boclass.maxchildren,
+                None if allowed_parents is None else frozenset(allowed_parents),
+                boclass.container,
+            )
+            cls._validation_cache[boclass] = rules
+        return rules
 
-        name = name.lower()
+    def _id_template(self, classname):
+        """Return a format string used to generate ids for classname."""
+        name = classname.split('.')[-1].lower()
 
         if pref.get_option('widget_naming_ufletter') == 'yes':
             name = name.capitalize()
-        return name
+
+        if pref.get_option('widget_naming_separator') == 'UNDERSCORE':
+            name = f'{name}_'
+        return name + '{}'
 
     def get_unique_id(self, classname, start_id=None):
+        # Read the naming preferences once, not on every try.
+        template = self._id_template(classname)
+        count = self.counter.get(classname, 0)
         if start_id is None:
-            self.counter[classname] += 1
-            start_id = self._generate_id(classname, self.counter[classname])
+            count += 1
+            start_id = template.format(count)
 
-        is_defined = self._is_id_defined('', start_id)
-        while is_defined is True:
-            self.counter[classname] += 1
-            start_id = self._generate_id(classname, self.counter[classname])
-            is_defined = self._is_id_defined('', start_id)
+        while start_id in self._used_names['id']:
+            count += 1
+            start_id = template.format(count)
+        self.counter[classname] = count
 
         return start_id
 
-    def paste_from_clipboard(self):
-        self.filter_remove(remember=True)
+    @classmethod
+    def _name_properties(cls, boclass):
+        props = cls._name_properties_cache.get(boclass)
+        if props is None:
+            props = (
+                frozenset(boclass.tkvar_properties),
+                frozenset(boclass.command_properties),
+            )
+            cls._name_properties_cache[boclass] = props
+        return props
 
-        tree = self.treeview
-        selected_item = ''
+    def _widget_names(self, data):
+        """Return the names defined by data, one tuple for each NAME_KINDS."""
+        tkvar_props, command_props = self._name_properties(
+            CLASS_MAP[data.classname].builder
+        )
+        tkvars = []
+        commands = []
+        for pname, value in data.properties.items():
+            if pname in tkvar_props:
+                # value format is [type:]name
+                tkvars.append(value.rsplit(':', 1)[-1])
+            if pname in command_props:
+                try:
+                    commands.append(json.loads(value)['value'])
+                except (ValueError, KeyError, TypeError):
+                    logger.debug('Invalid command value: %s', value)
+        bindings = [bind.handler for bind in data.bindings]
+        return ((data.identifier,), tuple(tkvars), tuple(commands), tuple(bindings))
+
+    def _add_item_names(self, item, names):
+        self._item_names[item] = names
+        for kind, kind_names in zip(self.NAME_KINDS, names):
+            used = self._used_names[kind]
+            for name in kind_names:
+                used[name] = used.get(name, 0) + 1
+
+    def _remove_item_names(self, item):
+        names = self._item_names.pop(item)
+        for kind, kind_names in zip(self.NAME_KINDS, names):
+            used = self._used_names[kind]
+            for name in kind_names:
+                count = used[name] - 1
+                if count:
+                    used[name] = count
+                else:
+                    del used[name]
 
-        if self.duplicating:
-            # Simulate the selected item (the one we're pasting to) as the
-            # parent of the first selected item we're duplicating.
-            selected_item = self.duplicate_parent_iid
-        else:
-            selection = tree.selection()
-            if selection:
-                selected_item = selection[0]
+    def paste_from_clipboard(self):
+        self.filter_remove(remember=True)
         try:
-            # If we're duplicating, we should get the copy data from a
-            # variable, not the clipboard.
+            tree = self.treeview
+            selected_item = ''
+
             if self.duplicating:
-                # Get the copy/duplicate data.
-                text = self.virtual_clipboard_for_duplicate
+                # Simulate the selected item (the one we're pasting to) as the
+                # parent of the first selected item we're duplicating.
+                selected_item = self.duplicate_parent_iid
             else:
-                text = tree.selection_get(selection='CLIPBOARD')
-
-            uidef = self.new_uidefinition()
-            uidef.load_from_string(text)
-            for wmeta in uidef.widgets():
-                if self._validate_add(selected_item, wmeta.classname):
-                    self.update_layout(selected_item, wmeta)
-                    self.populate_tree(
-                        selected_item, uidef, wmeta, is_first_widget_pasted=True
-                    )
-        except ET.ParseError:
-            msg = 'The clipboard does not have a valid widget xml definition.'
-            logger.error(msg)
-        except tk.TclError:
-            pass
+                selection = tree.selection()
+                if selection:
+                    selected_item = selection[0]
+            toplevel_count = len(self._children[''])
+            try:
+                # If we're duplicating, we should get the copy data from a
+                # variable, not the clipboard.
+                if self.duplicating:
+                    # The duplicate data is already a copy of the widgets,
+                    # no need to go through xml.
+                    for wmeta, children in self.virtual_clipboard_for_duplicate:
+                        if self._validate_add(selected_item, wmeta.classname):
+                            self.update_layout(selected_item, wmeta)
+                            self.populate_tree_from_copy(
+                                selected_item,
+                                wmeta,
+                                children,
+                                is_first_widget_pasted=True,
+                            )
+                else:
+                    text = tree.selection_get(selection='CLIPBOARD')
+
+                    # The clipboard may use widgets that are not loaded yet.
+                    self.app.load_all_widgets()
+                    uidef = self.new_uidefinition()
+                    uidef.load_from_string(text)
+                    children_map = self._widget_children_map(uidef)
+                    for wmeta in uidef.widgets():
+                        if self._validate_add(selected_item, wmeta.classname):
+                            self.update_layout(selected_item, wmeta)
+                            self.populate_tree(
+                                selected_item,
+                                uidef,
+                                wmeta,
+                                is_first_widget_pasted=True,
+                                children_map=children_map,
+                            )
+            except ET.ParseError:
+                msg = 'The clipboard does not have a valid widget xml definition.'
+                logger.error(msg)
+            except tk.TclError:
+                pass
+            finally:
+                self.duplicating = False
+                self.virtual_clipboard_for_duplicate = None
+
+            if selected_item == '':
+                # draw only the new toplevels
+                children = self._children[''][toplevel_count:]
+                for child in children:
+                    self.draw_widget(child)
+            else:
+                self.draw_widget(selected_item)
         finally:
-            self.duplicating = False
-            self.virtual_clipboard_for_duplicate = None
-
-        if selected_item == '':
-            # redraw all
-            children = tree.get_children('')
-            for child in children:
-                self.draw_widget(child)
-        else:
-            self.draw_widget(selected_item)
-
-        self.filter_restore()
+            self.filter_restore()
 
         # Get all the children widgets of the parent that we pasted into.
         children_of_parent = self.treeview.get_children(selected_item)
         if children_of_parent:
             # Select the last (latest) child so the user can see where the last
             # pasted item is.
-            self.treeview.after_idle(
-                lambda: self.treeview.selection_set(children_of_parent[-1])
-            )
-            self.treeview.after_idle(
-                lambda: self.treeview.focus(children_of_parent[-1])
-            )
-            self.treeview.after_idle(lambda: self.treeview.see(children_of_parent[-1]))
+            self.treeview.after_idle(self._focus_item, children_of_parent[-1])
 
     def update_layout(self, root, data):
         '''Removes layout info from element, when copied from clipboard.'''
@@ -835,12 +976,11 @@ class WidgetsTreeEditor:
 
         root = selected_item
         #  check if the widget can be added at selected point
-        parent = tree.parent(root)
+        parent = self._parent.get(root, '')
         has_parent = parent != root
         show_warnings = False if has_parent else True
         if not self._validate_add(root, wclass, show_warnings):
             #  if not try to add at item parent level
-            parent = tree.parent(root)
             if parent != root:
                 logger.info('Failed to add widget, trying one level up.')
                 if self._validate_add(parent, wclass):
@@ -878,13 +1018,21 @@ class WidgetsTreeEditor:
         self.draw_widget(item)
 
         # Select and show the item created
-        tree.after_idle(lambda: tree.selection_set(item))
-        tree.after_idle(lambda: tree.focus(item))
-        tree.after_idle(lambda: tree.see(item))
+        tree.after_idle(self._focus_item, item)
 
     def remove_all(self):
-        self.treedata = {}
+        # Reattach the hidden items first so they are deleted below.
         self.filter_remove()
+        self.treedata = {}
+        self._children = {'': []}
+        self._parent = {}
+        self._data_to_item.clear()
+        self._xmlnode_cache.clear()
+        self._data_signature_cache.clear()
+        self._grid_dim_cache.clear()
+        self._item_names.clear()
+        for used in self._used_names.values():
+            used.clear()
         children = self.treeview.get_children()
         if children:
             self.treeview.delete(*children)
@@ -905,22 +1053,47 @@ class WidgetsTreeEditor:
 
         dirname = os.path.dirname(os.path.abspath(filename))
         self.previewer.resource_paths.append(dirname)
+        children_map = self._widget_children_map(uidef)
         for widget in uidef.widgets():
-            self.populate_tree('', uidef, widget, from_file=True)
+            self.populate_tree(
+                '', uidef, widget, from_file=True, children_map=children_map
+            )
 
-        children = self.treeview.get_children('')
+        children = self._children['']
         for child in children:
             self.draw_widget(child)
         self.previewer.show_selected(None, None)
 
+    def _widget_children_map(self, uidef):
+        """Return a dict that maps widget ids to their children xml nodes.
+
+        Built with one pass over the definition so populate_tree does
+        not search the whole xml tree for every widget.
+        """
+        children_map = {}
+        for node in uidef.root.iter('object'):
+            identifier = node.get('id')
+            # Same as uidef.widget_children, the first node found wins.
+            if identifier is not None and identifier not in children_map:
+                children_map[identifier] = node.findall('./child/object')
+        return children_map
+
     def populate_tree(
-        self, master, uidef, wmeta, from_file=False, is_first_widget_pasted=False
+        self,
+        master,
+        uidef,
+        wmeta,
+        from_file=False,
+        is_first_widget_pasted=False,
+        children_map=None,
     ):
         """Reads xml nodes and populates tree item
 
         The argument: is_first_widget_pasted (bool) will be True if we're currently
         on the first widget that was pasted from the clipboard or duplicated.
         """
+        if children_map is None:
+            children_map = self._widget_children_map(uidef)
 
         cname = wmeta.classname
         original_id = wmeta.identifier
@@ -936,11 +1109,38 @@ class WidgetsTreeEditor:
                 is_first_widget_pasted=is_first_widget_pasted,
             )
 
-            for mchild in uidef.widget_children(original_id):
-                self.populate_tree(pwidget, uidef, mchild, from_file=from_file)
+            for cnode in children_map.get(original_id, ()):
+                mchild = uidef.xmlnode_to_widget(cnode)
+                self.populate_tree(
+                    pwidget,
+                    uidef,
+                    mchild,
+                    from_file=from_file,
+                    children_map=children_map,
+                )
         else:
             raise Exception(f'Class "{cname}" not mapped')
 
+    def populate_tree_from_copy(
+        self, master, wmeta, children, is_first_widget_pasted=False
+    ):
+        """Populates tree items from data returned by _copy_item_data"""
+
+        uniqueid = self.get_unique_id(wmeta.classname, wmeta.identifier)
+        wmeta.widget_property('id', uniqueid)
+
+        pwidget = self._insert_item(
+            master, wmeta, is_first_widget_pasted=is_first_widget_pasted
+        )
+        for cmeta, cchildren in children:
+            self.populate_tree_from_copy(pwidget, cmeta, cchildren)
+
+    def _copy_item_data(self, item):
+        """Return a copy of the item data and of all its descendants."""
+
+        children = [self._copy_item_data(child) for child in self._children[item]]
+        return (self.treedata[item].copy(), children)
+
     def get_available_row(self, parent, new_item_data):
         """
         Determine if new_item's row and column conflict with
@@ -971,34 +1171,34 @@ class WidgetsTreeEditor:
         new_item_row = new_item_data.layout_property('row')
         new_item_column = new_item_data.layout_property('column')
         new_item_name = new_item_data.identifier
+        new_row = int(new_item_row)
 
         # Check new_item's siblings to see if any of them have the exact same row/col.
-        children = self.treeview.get_children(parent)
-        for sibling in children:
-
-            sibling_properties = self.treedata[sibling]
-            sibling_name = sibling_properties.identifier
+        treedata = self.treedata
+        for sibling in self._children[parent]:
+            sibling_properties = treedata[sibling]
 
             # Don't check new_item because we're checking its siblings, not itself.
-            if sibling_name != new_item_name:
-
-                # Get the row/col of the new item's sibling.
-                sibling_row = sibling_properties.layout_property('row')
-                sibling_col = sibling_properties.layout_property('column')
-
-                # Keep track of the max row number in the new item's column,
-                # because we may need to use it after the loop is done.
-                if sibling_col == new_item_column and int(sibling_row) > max_row:
-                    max_row = int(sibling_row)
-
-                # If the item that is being pasted (the new item) has the same
-                # row AND column as one its new siblings, then we need to set
-                # the new item's row number to max_rows + 1.
-                if sibling_row == new_item_row and sibling_col == new_item_column:
-
-                    # Set the flag but keep the loop going because we still
-                    # need to find out what the max row number is.
-                    increase_row = True
+            # Only siblings in the new item's column matter.
+            if (
+                sibling_properties.identifier == new_item_name
+                or sibling_properties.layout_property('column') != new_item_column
+            ):
+                continue
+
+            # Keep track of the max row number in the new item's column,
+            # because we may need to use it after the loop is done.
+            sibling_row = int(sibling_properties.layout_property('row'))
+            if sibling_row > max_row:
+                max_row = sibling_row
+
+            # If the item that is being pasted (the new item) has the same
+            # row AND column as one its new siblings, then we need to set
+            # the new item's row number to max_rows + 1.
+            # Keep the loop going because we still need to find out
+            # what the max row number is.
+            if sibling_row == new_row:
+                increase_row = True
 
         if increase_row:
             new_item_row = str(max_row + 1)
@@ -1006,15 +1206,14 @@ class WidgetsTreeEditor:
         return new_item_row
 
     def get_max_row(self, item):
-        tree = self.treeview
-        max_row = -1
-        children = tree.get_children(item)
-        for child in children:
-            row = self.treedata[child].layout_property('row')
-            row = int(row)
-            if row > max_row:
-                max_row = row
-        return max_row
+        treedata = self.treedata
+        return max(
+            (
+                int(treedata[child].layout_property('row'))
+                for child in self._children[item]
+            ),
+            default=-1,
+        )
 
     def on_treeview_select(self, event):
         tree = self.treeview
@@ -1038,7 +1237,9 @@ class WidgetsTreeEditor:
     def update_event(self, hint, obj):
         """Updates tree colums when itemdata is changed."""
 
+        self._xmlnode_cache.pop(obj, None)
         if not self._listen_object_updates:
+            self._data_signature_cache.pop(obj, None)
             return
 
         tree = self.treeview
@@ -1046,27 +1247,47 @@ class WidgetsTreeEditor:
         item = self.get_item_by_data(obj)
         item_text = f'{data.identifier}: {data.classname}'
         if item:
-            if item_text != tree.item(item, 'text'):
-                tree.item(item, text=item_text)
+            # Setters notify even when the value is the same,
+            # skip the redraw if nothing changed.
+            signature = self._data_signature(data)
+            if signature == self._data_signature_cache.get(data):
+                return
+            self._data_signature_cache[data] = signature
+            self._grid_dim_cache.pop(self._parent[item], None)
+            names = self._widget_names(data)
+            if names != self._item_names[item]:
+                self._remove_item_names(item)
+                self._add_item_names(item, names)
+            # Write text and values with a single item call, setting them
+            # costs the same as reading them back to compare.
+            options = {'text': item_text}
             # if tree.parent(item) != '' and 'layout' in data:
-            if tree.parent(item) != '' and data.layout_required:
+            if self._parent[item] != '' and data.layout_required:
                 if data.manager == 'grid':
                     row = data.layout_property('row')
                     col = data.layout_property('column')
-                    values = tree.item(item, 'values')
-                    if row != values[1] or col != values[2]:
-                        values = (data.classname, row, col)
-                    tree.item(item, values=values)
+                    options['values'] = (data.classname, row, col)
+            tree.item(item, **options)
             self.draw_widget(item)
             self.app.set_changed()
 
+    @staticmethod
+    def _data_signature(data):
+        """Return a snapshot of the widget data fields, see WidgetMeta.copy"""
+        return (
+            data.identifier,
+            data.classname,
+            data.manager,
+            tuple(data.properties.items()),
+            tuple(data.bindings),
+            tuple(data.layout_properties.items()),
+            data.container_manager,
+            tuple(data.container_properties.items()),
+            tuple(data.gridrc_properties),
+        )
+
     def get_item_by_data(self, data):
-        skey = None
-        for key, value in self.treedata.items():
-            if value == data:
-                skey = key
-                break
-        return skey
+        return self._data_to_item.get(data)
 
     def on_item_nav_up(self, event=None):
         '''Move selection to prev item'''
@@ -1111,44 +1332,54 @@ class WidgetsTreeEditor:
         sel = tree.selection()
         if sel:
             self.filter_remove(remember=True)
-            item = sel[0]
-            parent = tree.parent(item)
-            prev = tree.prev(item)
-            if prev:
-                prev_idx = tree.index(prev)
-                tree.move(item, parent, prev_idx)
-                item_data = self.treedata[item]
-                manager = item_data.manager
-                layout_required = item_data.layout_required
-                self.app.set_changed()
-
-                # Always refresh preview for objects that don't
-                # require a layout, such as menus and notebook tabs.
-                if manager in ('pack', 'place') or not layout_required:
-                    self.draw_widget(item)
-            self.filter_restore()
+            try:
+                item = sel[0]
+                parent = self._parent[item]
+                prev = tree.prev(item)
+                if prev:
+                    prev_idx = tree.index(prev)
+                    tree.move(item, parent, prev_idx)
+                    siblings = self._children[parent]
+                    siblings.remove(item)
+                    siblings.insert(prev_idx, item)
+                    item_data = self.treedata[item]
+                    manager = item_data.manager
+                    layout_required = item_data.layout_required
+                    self.app.set_changed()
+
+                    # Always refresh preview for objects that don't
+                    # require a layout, such as menus and notebook tabs.
+                    if manager in ('pack', 'place') or not layout_required:
+                        self.draw_widget(item)
+            finally:
+                self.filter_restore()
 
     def on_item_move_down(self, event):
         tree = self.treeview
         sel = tree.selection()
         if sel:
             self.filter_remove(remember=True)
-            item = sel[0]
-            parent = tree.parent(item)
-            next = tree.next(item)
-            if next:
-                next_idx = tree.index(next)
-                tree.move(item, parent, next_idx)
-                item_data = self.treedata[item]
-                manager = item_data.manager
-                layout_required = item_data.layout_required
-                self.app.set_changed()
-
-                # Always refresh preview for objects that don't
-                # require a layout, such as menus and notebook tabs.
-                if manager in ('pack', 'place') or not layout_required:
-                    self.draw_widget(item)
-            self.filter_restore()
+            try:
+                item = sel[0]
+                parent = self._parent[item]
+                next = tree.next(item)
+                if next:
+                    next_idx = tree.index(next)
+                    tree.move(item, parent, next_idx)
+                    siblings = self._children[parent]
+                    siblings.remove(item)
+                    siblings.insert(next_idx, item)
+                    item_data = self.treedata[item]
+                    manager = item_data.manager
+                    layout_required = item_data.layout_required
+                    self.app.set_changed()
+
+                    # Always refresh preview for objects that don't
+                    # require a layout, such as menus and notebook tabs.
+                    if manager in ('pack', 'place') or not layout_required:
+                        self.draw_widget(item)
+            finally:
+                self.filter_restore()
 
     #
     # Item grid move functions
@@ -1158,33 +1389,36 @@ class WidgetsTreeEditor:
         selection = tree.selection()
         if selection:
             self.filter_remove(remember=True)
-            for item in selection:
-                data = self.treedata[item]
-
-                if data.manager != 'grid':
-                    break
-
-                current_row = new_row = int(data.layout_property('row'))
-                current_col = new_col = int(data.layout_property('column'))
-                if direction == self.GRID_UP:
-                    if current_row > 0:
-                        new_row = current_row - 1
-                elif direction == self.GRID_DOWN:
-                    new_row = current_row + 1
-                elif direction == self.GRID_LEFT:
-                    if current_col > 0:
-                        new_col = current_col - 1
-                elif direction == self.GRID_RIGHT:
-                    new_col = current_col + 1
-
-                if current_row != new_row:
-                    data.layout_property('row', str(new_row))
-                    data.notify()
-                if current_col != new_col:
-                    data.layout_property('column', str(new_col))
-                    data.notify()
-                root = tree.parent(item)
-            self.filter_restore()
+            try:
+                for item in selection:
+                    data = self.treedata[item]
+
+                    if data.manager != 'grid':
+                        break
+
+                    current_row = new_row = int(data.layout_property('row'))
+                    current_col = new_col = int(data.layout_property('column'))
+                    if direction == self.GRID_UP:
+                        if current_row > 0:
+                            new_row = current_row - 1
+                    elif direction == self.GRID_DOWN:
+                        new_row = current_row + 1
+                    elif direction == self.GRID_LEFT:
+                        if current_col > 0:
+                            new_col = current_col - 1
+                    elif direction == self.GRID_RIGHT:
+                        new_col = current_col + 1
+
+                    if current_row != new_row or current_col != new_col:
+                        # Set both values and notify once, so the widget
+                        # is redrawn a single time.
+                        self._listen_object_updates = False
+                        data.layout_property('row', str(new_row))
+                        data.layout_property('column', str(new_col))
+                        self._listen_object_updates = True
+                        data.notify('LAYOUT_CHANGED', data)
+            finally:
+                self.filter_restore()
 
     #
     # Filter functions
@@ -1197,12 +1431,14 @@ class WidgetsTreeEditor:
             self.filter_remove()
             return
 
+        self._filter_suspended = 0
         self._expand_all()
         self.treeview.selection_set('')
 
-        children = self.treeview.get_children('')
-        for item in children:
-            _, detached = self._detach(item)
+        value = self.filtervar.get()
+        children = self._children['']
+        for idx, item in enumerate(children):
+            _, detached = self._detach(item, '', idx, value)
             if detached:
                 self._detached.extend(detached)
         for i, p, idx in self._detached:
@@ -1211,6 +1447,8 @@ class WidgetsTreeEditor:
         self.filter_on = True
 
     def filter_remove(self, remember=False):
+        if remember:
+            self._filter_suspended += 1
         if self.filter_on:
             sitem = None
             selection = self.treeview.selection()
@@ -1222,11 +1460,20 @@ class WidgetsTreeEditor:
                 self.filter_prev_sitem = sitem
             self._reatach()
             self.filtervar.set('')
+            # Items are already reattached.
+            self._cancel_pending_filter()
         self.filter_on = False
 
     def filter_restore(self):
+        if self._filter_suspended:
+            self._filter_suspended -= 1
+            if self._filter_suspended:
+                return
         if self.filter_prev_value:
             self.filtervar.set(self.filter_prev_value)
+            # Filter now, the item is selected again below.
+            self._cancel_pending_filter()
+            self.filter_by(self.filter_prev_value)
             item = self.filter_prev_sitem
             if item and self.treeview.exists(item):
                 self.treeview.selection_set(item)
@@ -1235,6 +1482,13 @@ class WidgetsTreeEditor:
             self.filter_prev_value = ''
             self.filter_prev_sitem = None
 
+    def _focus_item(self, item):
+        """Select, focus and show item."""
+        tree = self.treeview
+        tree.selection_set(item)
+        tree.focus(item)
+        tree.see(item)
+
     def _see(self, item):
         # The item may have been deleted.
         try:
@@ -1243,63 +1497,68 @@ class WidgetsTreeEditor:
             pass
 
     def _expand_all(self, rootitem=''):
-        children = self.treeview.get_children(rootitem)
-        for item in children:
-            self._expand_all(item)
-        if rootitem != '' and children:
+        stack = list(self._children[rootitem])
+        if rootitem != '' and stack:
             self.treeview.item(rootitem, open=True)
+        while stack:
+            item = stack.pop()
+            children = self._children[item]
+            if children:
+                self.treeview.item(item, open=True)
+                stack.extend(children)
 
     def _reatach(self):
         """Reinsert the hidden items."""
+        if not self._detached:
+            return
+        # Items are moved back in the order they were detached, so each
+        # index is valid once the previous siblings are back.
+        move = self.treeview.move
+        alive = self._parent
         for item, p, idx in self._detached:
             # The item may have been deleted.
-            if self.treeview.exists(item) and self.treeview.exists(p):
-                self.treeview.move(item, p, idx)
+            if item in alive and (p == '' or p in alive):
+                move(item, p, idx)
         self._detached = []
 
-    def _detach(self, item):
-        """Hide items from treeview that do not match the search string."""
-        to_detach = []
-        children_det = []
-        children_match = False
-        match_found = False
-
-        value = self.filtervar.get()
-        txt = self.treeview.item(item, 'text').lower()
-        if value in txt:
-            match_found = True
-        else:
-            class_txt = self.treedata[item].classname.lower()
-            if value in class_txt:
-                match_found = True
+    def _detach(self, item, parent, idx, value):
+        """Hide items from treeview that do not match the search string.
 
-        parent = self.treeview.parent(item)
-        idx = self.treeview.index(item)
-        children = self.treeview.get_children(item)
-        if children:
-            for child in children:
-                match, detach = self._detach(child)
-                children_match = children_match | match
-                if detach:
-                    children_det.extend(detach)
-
-        if match_found:
-            if children_det:
-                to_detach.extend(children_det)
-        else:
-            if children_match:
-                if children_det:
-                    to_detach.extend(children_det)
-            else:
-                to_detach.append((item, parent, idx))
-        match_found = match_found | children_match
-        return match_found, to_detach
+        parent and idx are the current position of item in the tree.
+        Returns if item or one of its descendants matches value, and the
+        list of (item, parent, idx) to detach.
+        """
+        to_detach = []
+        matches = {}
+        # The second visit of an item, after its children, carries the
+        # length of to_detach at the first visit.
+        stack = [(item, parent, idx, None)]
+        while stack:
+            current, cparent, cidx, start = stack.pop()
+            children = self._children[current]
+            if start is None:
+                stack.append((current, cparent, cidx, len(to_detach)))
+                for child_idx in range(len(children) - 1, -1, -1):
+                    stack.append((children[child_idx], current, child_idx, None))
+                continue
+
+            # Same text as the tree item label, it includes the class name.
+            data = self.treedata[current]
+            txt = f'{data.identifier}: {data.classname}'.lower()
+            match_found = value in txt
+            children_match = any([matches.pop(child) for child in children])
+            if not (match_found or children_match):
+                # Detaching the item hides its descendants too.
+                del to_detach[start:]
+                to_detach.append((current, cparent, cidx))
+            matches[current] = match_found or children_match
+        return matches[item], to_detach
 
     #
     # End Filter functions
     #
     def _top_widget_iterator(self):
-        children = self.treeview.get_children('')
+        children = self._children['']
         for item in children:
             data = self.treedata[item]
             yield (item, data)
@@ -1338,111 +1597,58 @@ class WidgetsTreeEditor:
             tree = self.treeview
             self.filter_remove()
             self._expand_all()
-            tree.after_idle(lambda: tree.selection_set(found))
-            tree.after_idle(lambda: tree.focus(found))
-            tree.after_idle(lambda: tree.see(found))
+            tree.after_idle(self._focus_item, found)
 
     def is_id_unique(self, idvalue) -> bool:
         "Check if idvalue is unique in all UI tree."
         # Used in ID validation
         is_unique = (
-            not self._is_id_defined('', idvalue)
-            and not self._is_tkvar_defined('', idvalue)
-            and not self._is_command_defined('', idvalue)
-            and not self._is_binding_defined('', idvalue)
+            not self._is_id_defined(idvalue)
+            and not self._is_tkvar_defined(idvalue)
+            and not self._is_command_defined(idvalue)
+            and not self._is_binding_defined(idvalue)
         )
         return is_unique
 
-    def _is_id_defined(self, root, widget_id) -> bool:
+    def _is_id_defined(self, widget_id) -> bool:
         """Search widget id in the tree."""
-        is_defined = False
-        if root != '':
-            data = self.treedata[root]
-            if data.identifier == widget_id:
-                is_defined = True
-        if is_defined is False:
-            for item in self.treeview.get_children(root):
-                is_defined = self._is_id_defined(item, widget_id)
-                if is_defined is True:
-                    break
-        return is_defined
-
-    def _is_tkvar_defined(self, root, varname) -> bool:
+        return widget_id in self._used_names['id']
+
+    def _is_tkvar_defined(self, varname) -> bool:
         """Search variable name in the tree."""
-        is_defined = False
-        if root != '':
-            data = self.treedata[root]
-            builder = CLASS_MAP[data.classname].builder
-            for pname, value in data.properties.items():
-                if pname in builder.tkvar_properties:
-                    vname = value
-                    if ':' in value:
-                        vtype, vname = value.split(':')
-                    if vname == varname:
-                        is_defined = True
-        if is_defined is False:
-            for item in self.treeview.get_children(root):
-                is_defined = self._is_tkvar_defined(item, varname)
-                if is_defined is True:
-                    break
-        return is_defined
-
-    def _is_binding_defined(self, root, cbname) -> bool:
+        return varname in self._used_names['tkvar']
+
+    def _is_binding_defined(self, cbname) -> bool:
         """Search callback binding name in the tree."""
-        is_defined = False
-        if root != '':
-            data = self.treedata[root]
-            for bind in data.bindings:
-                if bind.handler == cbname:
-                    is_defined = True
-        if is_defined is False:
-            for item in self.treeview.get_children(root):
-                is_defined = self._is_binding_defined(item, cbname)
-                if is_defined is True:
-                    break
-        return is_defined
-
-    def _is_command_defined(self, root, command_name) -> bool:
+        return cbname in self._used_names['binding']
+
+    def _is_command_defined(self, command_name) -> bool:
         """Searh command name in the tree."""
-        is_defined = False
-        if root != '':
-            data = self.treedata[root]
-            builder = CLASS_MAP[data.classname].builder
-            for pname, value in data.properties.items():
-                if pname in builder.command_properties:
-                    cmd = json.loads(value)
-                    if command_name == cmd['value']:
-                        is_defined = True
-        if is_defined is False:
-            for item in self.treeview.get_children(root):
-                is_defined = self._is_command_defined(item, command_name)
-                if is_defined is True:
-                    break
-        return is_defined
+        return command_name in self._used_names['command']
 
     def is_command_valid(self, cmdname):
         """Check if command name does not collide with other names."""
         is_valid = (
-            not self._is_id_defined('', cmdname)
-            and not self._is_binding_defined('', cmdname)
-            and not self._is_tkvar_defined('', cmdname)
+            not self._is_id_defined(cmdname)
+            and not self._is_binding_defined(cmdname)
+            and not self._is_tkvar_defined(cmdname)
         )
         return is_valid
 
     def is_tkvar_valid(self, varname):
         """Check if tkvarname does not collide with other names."""
         is_valid = (
-            not self._is_id_defined('', varname)
-            and not self._is_command_defined('', varname)
-            and not self._is_binding_defined('', varname)
+            not self._is_id_defined(varname)
+            and not self._is_command_defined(varname)
+            and not self._is_binding_defined(varname)
         )
         return is_valid
 
     def is_binding_valid(self, cmdname):
         """Check if binding name does not collide with other names."""
         is_valid = (
-            not self._is_id_defined('', cmdname)
-            and not self._is_command_defined('', cmdname)
-            and not self._is_tkvar_defined('', cmdname)
+            not self._is_id_defined(cmdname)
+            and not self._is_command_defined(cmdname)
+            and not self._is_tkvar_defined(cmdname)
         )
         return is_valid
@@ -45,19 +45,44 @@ class Key:
     X = Keydef('x', 88 if osnt else 53)
 
 
+def _key_id(key):
+    '''Return the value used to match key with key events.'''
+    if osnt or oslinux:
+        return key.code
+    # TODO: keycode in mac is not unique?
+    #
+    # Default match with keysym
+    return key.sym
+
+
+def _event_key_id(event):
+    '''Return the value of event to compare with _key_id.'''
+    if osnt or oslinux:
+        return event.keycode
+    return event.keysym
+
+
 def key_bind(key, callback):
     '''Key Event decorator.
     Run callback if key of event match'''
+    key_id = _key_id(key)
+
+    def key_event_manager(event):
+        if _event_key_id(event) == key_id:
+            callback(event)
+
+    return key_event_manager
+
+
+def key_dispatcher(bindings):
+    '''Key Event dispatcher.
+    bindings is a sequence of (key, callback) pairs.
+    Run the callback that matches the key of the event'''
+    callbacks = {_key_id(key): callback for key, callback in bindings}
 
     def key_event_manager(event):
-        if osnt or oslinux:
-            if event.keycode == key.code:
-                callback(event)
-        else:
-            # TODO: keycode in mac is not unique?
-            #
-            # Default match with keysym
-            if event.keysym == key.sym:
-                callback(event)
+        callback = callbacks.get(_event_key_id(event))
+        if callback is not None:
+            callback(event)
 
     return key_event_manager
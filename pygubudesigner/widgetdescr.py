@@ -32,7 +32,15 @@ logger = logging.getLogger(__name__)
 
 
 class WidgetMeta(WidgetMetaBase, Observable):
+    # True when setup_defaults was called and the defaults are not loaded yet.
+    _defaults_pending = False
+
+    def apply_properties_defaults(self):
+        self._load_pending_defaults()
+        super().apply_properties_defaults()
+
     def apply_layout_defaults(self):
+        self._load_pending_defaults()
         super().apply_layout_defaults()
         self.notify('LAYOUT_CHANGED', self)
 
@@ -133,6 +141,17 @@ class WidgetMeta(WidgetMetaBase, Observable):
             self.clear_layout()
         self.notify('LAYOUT_CHANGED', self)
 
+    def copy(self):
+        """Return a copy of the widget description without observers."""
+        wcopy = WidgetMeta(self.classname, self.identifier, manager=self.manager)
+        wcopy.properties = self.properties.copy()
+        wcopy.bindings = list(self.bindings)
+        wcopy.layout_properties = self.layout_properties.copy()
+        wcopy.container_manager = self.container_manager
+        wcopy.container_properties = self.container_properties.copy()
+        wcopy.gridrc_properties = list(self.gridrc_properties)
+        return wcopy
+
     def get_bindings(self):
         blist = []
         for v in self.bindings:
@@ -146,9 +165,15 @@ class WidgetMeta(WidgetMetaBase, Observable):
         self.bindings.append(BindingMeta(seq, handler, add))
 
     def setup_defaults(self):
-        propd, layoutd = WidgetMeta.get_widget_defaults(self, self.identifier)
-        self.properties_defaults = propd
-        self.layout_defaults = layoutd
+        # Defaults are only used when applied, load them at that time.
+        self._defaults_pending = True
+
+    def _load_pending_defaults(self):
+        if self._defaults_pending:
+            self._defaults_pending = False
+            propd, layoutd = WidgetMeta.get_widget_defaults(self, self.identifier)
+            self.properties_defaults = propd
+            self.layout_defaults = layoutd
 
     @staticmethod
     def get_widget_defaults(wclass, widget_id):
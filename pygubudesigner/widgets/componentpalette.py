@@ -91,6 +91,12 @@ class ComponentPalette(ttk.Frame):
         b.pack(side='left')
         self._buttons.append((b, group))
 
+    def clear(self):
+        for tab in self._tabs.values():
+            tab.destroy()
+        self._tabs = {}
+        self._buttons = []
+
     def show_group(self, group):
         for b, g in self._buttons:
             if g == group:
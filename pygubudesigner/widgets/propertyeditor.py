@@ -33,6 +33,8 @@ import tkinter.ttk as ttk
 from pygubu.widgets.combobox import Combobox
 from pygubu.widgets.scrollbarhelper import ScrollbarHelper
 
+from pygubudesigner.util import get_ttk_style
+
 EDITORS = {}
 KEY_PRESS_CB_MILISECONDS = 500
 
@@ -66,7 +68,7 @@ class PropertyEditor(ttk.Frame):
         ttk.Frame.__init__(self, master, **kw)
 
         if not PropertyEditor.style_initialized:
-            s = ttk.Style()
+            s = get_ttk_style()
             s.configure('PropertyEditorInvalid.TFrame', background='red')
         self.configure(borderwidth=2)
         self._create_ui()
@@ -22,10 +22,13 @@ class ToplevelFramePreview(tk.Frame):
         self.tl_attrs = {}
         self._w_set = False
         self._h_set = False
+        # (width, height) resizable flags from the 'resizable' property.
+        self._resizable_flags = (True, True)
 
     def configure(self, cnf=None, **kw):
         if kw:
-            cnf = tk._cnfmerge((cnf, kw))
+            # kw is a new dict, use it as is when it is the only source.
+            cnf = kw if cnf is None else tk._cnfmerge((cnf, kw))
         elif cnf:
             cnf = tk._cnfmerge(cnf)
         key = 'width'
@@ -40,10 +43,8 @@ class ToplevelFramePreview(tk.Frame):
                 remove = True
             if maxsize and value > maxsize[0]:
                 remove = True
-            if self._w_set:
-                resizable = self.tl_attrs.get('resizable', None)
-                if resizable and not TKToplevel.RESIZABLE[resizable][0]:
-                    remove = True
+            if self._w_set and not self._resizable_flags[0]:
+                remove = True
             if remove:
                 #                print('rm', key, value)
                 cnf.pop(key)
@@ -60,10 +61,8 @@ class ToplevelFramePreview(tk.Frame):
                 remove = True
             if maxsize and value > maxsize[1]:
                 remove = True
-            if self._h_set:
-                resizable = self.tl_attrs.get('resizable', None)
-                if resizable and not TKToplevel.RESIZABLE[resizable][1]:
-                    remove = True
+            if self._h_set and not self._resizable_flags[1]:
+                remove = True
             if remove:
                 #                print('rm', key, value)
                 cnf.pop(key)
@@ -130,8 +129,9 @@ class ToplevelFramePreviewBO(BuilderObject):
                     elif tw.grid_slaves():
                         tw.grid_propagate(0)
         elif pname == 'resizable':
-            # Do nothing, fake 'resizable' property for Toplevel preview
-            pass
+            # Fake 'resizable' property for Toplevel preview,
+            # only used to limit width and height changes.
+            tw._resizable_flags = TKToplevel.RESIZABLE[value] if value else (True, True)
         elif pname == 'modal':
             # Do nothing, fake 'modal' property for dialog preview
             pass